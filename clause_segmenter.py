@@ -1,18 +1,48 @@
 from __future__ import annotations
 import os
-from PyPDF2 import PdfReader
 import re
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
-
-@dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Set, Callable, Tuple, Iterable, Iterator
+
+# PDF backends: PyMuPDF when available, PyPDF2 otherwise
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24.3
+    except ImportError:
+        pymupdf = None
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+# Optional faster regex engines for the heading scan (see _build_heading_scanner)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import pcre2
+except ImportError:
+    pcre2 = None
+
+@dataclass(slots=True)
 class Section:
     section_id: int
     heading: Optional[str]
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Clause:
     clause_id: int            
     section_id: int          
@@ -21,44 +51,291 @@ class Clause:
     label: Optional[str]         # e.g. "(a)" or "a)" or None
     text: str
 
-# "SECTION 1. TERM", "Article II – Payment"
-SECTION_HEADING_PATTERN = re.compile(
-    r'^\s*(section|article)\s+([0-9ivxlcdm]+)[\.\-)]?\s+.*',
-    re.IGNORECASE
-)
 
-# "1. TERM", "1.1 Scope", "2.3.4 Some Heading"
-NUMBERED_HEADING_PATTERN = re.compile(
-    r'^\s*\d+(\.\d+)*\s+.+'
-)
+def _clause_to_dict(c: Clause) -> Dict[str, Any]:
+    # Clause fields are all scalars, so skip asdict()'s recursive deep copy
+    return {
+        "clause_id": c.clause_id,
+        "section_id": c.section_id,
+        "section_heading": c.section_heading,
+        "local_index": c.local_index,
+        "label": c.label,
+        "text": c.text,
+    }
 
 # ALL CAPS headings: "CONFIDENTIALITY", "LIMITATION OF LIABILITY"
 # We infer heading if line has mostly uppercase letters.
+# For ASCII lines the letters are counted in C: translate maps each byte to
+# 1 (A-Z / A-Za-z) or 0, then bytes.count tallies the ones.
+_ASCII_UPPER_TABLE = bytes(1 if 0x41 <= i <= 0x5A else 0 for i in range(256))
+_ASCII_ALPHA_TABLE = bytes(
+    1 if 0x41 <= i <= 0x5A or 0x61 <= i <= 0x7A else 0 for i in range(256)
+)
+
 def looks_like_all_caps_heading(line: str, min_len: int = 5, min_upper_ratio: float = 0.8) -> bool:
     s = line.strip()
     if len(s) < min_len:
         return False
+    if s.isascii():
+        b = s.encode("ascii")
+        n_letters = b.translate(_ASCII_ALPHA_TABLE).count(1)
+        if not n_letters:
+            return False
+        n_upper = b.translate(_ASCII_UPPER_TABLE).count(1)
+        return n_upper / n_letters >= min_upper_ratio
+
     letters = [c for c in s if c.isalpha()]
     if not letters:
         return False
     upper_ratio = sum(c.isupper() for c in letters) / len(letters)
     return upper_ratio >= min_upper_ratio
 
-#   "(a) Text", "(1) Text", "(i) Text"
-SUBCLAUSE_PAREN_PATTERN = re.compile(r'^\s*\(([a-zA-Z0-9ivxlcdm]+)\)\s+')
+# [^\S\n] is any Unicode blank except newline: PDF text often separates
+# "1.1\xa0Scope" or "(a)\xa0Affiliate" with a no-break space, and those
+# must still be headings and subclause markers.
+#
+# "SECTION 1. TERM", "Article II – Payment"
+# Case folding is ASCII-only ((?ai:...)) for speed; whitespace stays Unicode.
+_SECTION_HEADING_EXPRESSION = (
+    r'(?ai:section|article)[^\S\n]+(?ai:[0-9ivxlcdm]+)[\.\-)]?[^\S\n]+[^\n]'
+)
+
+# "1. TERM", "1.1 Scope", "2.3.4 Some Heading"
+_NUMBERED_HEADING_EXPRESSION = r'\d+(?:\.\d+)*[^\S\n]+[^\n]'
+
+# Single multi-line scan for both heading forms, so the whole document goes
+# through the regex engine once instead of per line.
+HEADING_PATTERN = re.compile(
+    r'^[^\S\n]*(?:'
+    + _SECTION_HEADING_EXPRESSION
+    + r'|'
+    + _NUMBERED_HEADING_EXPRESSION
+    + r')',
+    re.MULTILINE
+)
+
+# The same heading forms for the optional engines (caseless, multi-line),
+# kept to syntax shared by RE2, Hyperscan and PCRE2. They only ever see
+# ASCII text, where the blanks Python's \s matches are exactly these.
+_ASCII_BLANK = r'[\t\x0b\x0c\r\x1c-\x1f ]'
+HEADING_EXPRESSION = (
+    r'^' + _ASCII_BLANK + r'*(?:'
+    r'(?:section|article)' + _ASCII_BLANK + r'+[0-9ivxlcdm]+[\.\-)]?' + _ASCII_BLANK + r'+[^\n]'
+    r'|[0-9]+(?:\.[0-9]+)*' + _ASCII_BLANK + r'+[^\n]'
+    r')'
+)
+
+
+def _build_heading_scanner() -> Optional[Callable[[bytes], Set[int]]]:
+    """
+    Compile HEADING_EXPRESSION for the fastest installed engine: PCRE2 with
+    JIT compilation, then Hyperscan, then RE2 (both linear-time DFAs).
+    An engine that fails to compile the expression is skipped. Returns None
+    when none is usable, in which case HEADING_PATTERN (stdlib re) is used.
+
+    The returned scanner takes ASCII-only text encoded to bytes, so byte
+    offsets are also str offsets. Other text goes through HEADING_PATTERN.
+    """
+    expression = HEADING_EXPRESSION.encode("ascii")
+
+    if pcre2 is not None:
+        try:
+            pattern = pcre2.compile(
+                expression, pcre2.IGNORECASE | pcre2.MULTILINE, jit=True
+            )
+        except Exception:
+            # e.g. a platform without JIT support; fall through
+            pass
+        else:
+            def scan_pcre2(buf: bytes) -> Set[int]:
+                return {m.start() for m in pattern.finditer(buf)}
+
+            return scan_pcre2
+
+    if hyperscan is not None:
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[expression],
+                ids=[0],
+                elements=1,
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE],
+            )
+        except Exception:
+            # e.g. a CPU Hyperscan doesn't support; fall through
+            pass
+        else:
+            def scan_hyperscan(buf: bytes) -> Set[int]:
+                # Hyperscan reports match end offsets; map each back to its line.
+                offsets: Set[int] = set()
+
+                def on_match(id, start, end, flags, context):
+                    offsets.add(buf.rfind(b"\n", 0, end) + 1)
+
+                db.scan(buf, match_event_handler=on_match)
+                return offsets
+
+            return scan_hyperscan
+
+    if re2 is not None:
+        try:
+            pattern = re2.compile(b"(?im)" + expression)
+        except Exception:
+            pass
+        else:
+            def scan_re2(buf: bytes) -> Set[int]:
+                return {m.start() for m in pattern.finditer(buf)}
+
+            return scan_re2
+
+    return None
+
+
+_heading_scanner = _build_heading_scanner()
+
+# Preprocessing
+LINE_BREAK_PATTERN = re.compile(r'\r\n?')
+# Only runs that change when collapsed to one space: 2+ chars, or any tab
+WHITESPACE_PATTERN = re.compile(r' [ \t]+|\t[ \t]*')
 
 #   "a) Text", "1) Text"
 SUBCLAUSE_SUFFIX_PATTERN = re.compile(r'^\s*([a-zA-Z0-9ivxlcdm]+)\)\s+')
+# Strips a suffix marker that directly follows a "(a)" marker
+# (see _split_subclause_marker)
+_suffix_match = SUBCLAUSE_SUFFIX_PATTERN.match
+
+# "(a) Text", "(1) Text", "(i) Text" or the suffix form above, in one match.
+# Whitespace is [^\S\n] so the pattern can also scan a whole section for
+# marker lines (see _line_scanner).
+_PAREN_MARKER_EXPRESSION = r'\((?P<paren>[a-zA-Z0-9ivxlcdm]+)\)'
+_SUFFIX_MARKER_EXPRESSION = r'(?P<suffix>[a-zA-Z0-9ivxlcdm]+)\)'
+SUBCLAUSE_PATTERN = re.compile(
+    r'^[^\S\n]*(?:' + _PAREN_MARKER_EXPRESSION + r'|' + _SUFFIX_MARKER_EXPRESSION + r')[^\S\n]+',
+    re.MULTILINE
+)
+
+
+def _line_scanner(pattern: re.Pattern) -> Callable[[str], List[int]]:
+    """
+    Build a function returning the start offset of every line whose start
+    matches `pattern` (a "^"-anchored MULTILINE pattern that never matches
+    across a newline), in order.
+
+    Scanning with finditer on "^..." makes re retry the pattern at every
+    character. The same expression behind a literal "\n" lets re jump from
+    newline to newline with its prefix search (~4x faster); only the first
+    line then needs a separate match.
+    """
+    match = pattern.match
+    finditer = re.compile("\n" + pattern.pattern[1:], pattern.flags).finditer
+
+    def line_starts(text: str) -> List[int]:
+        starts = [0] if match(text) else []
+        starts.extend([m.start() + 1 for m in finditer(text)])
+        return starts
+
+    return line_starts
+
+
+def _flush_clause(
+    clauses: List[Clause],
+    sec: Section,
+    text_block: str,
+    label: Optional[str],
+    local_index: int,
+) -> int:
+    """
+    Append a clause for `text_block` (if non-blank once stripped) to `clauses`.
+    Returns the section-local index of the last clause appended.
+    """
+    text_block = text_block.strip()
+    if not text_block:
+        return local_index
+    local_index += 1
+    clauses.append(
+        Clause(
+            clause_id=len(clauses) + 1,
+            section_id=sec.section_id,
+            section_heading=sec.heading,
+            local_index=local_index,
+            label=label,
+            text=text_block,
+        )
+    )
+    return local_index
+
+# Documents from one template use one heading and one subclause form, so
+# ContractSegmenter can be restricted to them (see heading_style and
+# subclause_style). Each heading style maps to (multi-line pattern or None,
+# whether ALL CAPS lines are headings).
+HEADING_STYLES: Dict[str, Tuple[Optional[re.Pattern], bool]] = {
+    "any": (HEADING_PATTERN, True),
+    "section": (
+        re.compile(
+            r'^[^\S\n]*' + _SECTION_HEADING_EXPRESSION,
+            re.MULTILINE
+        ),
+        False,
+    ),
+    "numbered": (
+        re.compile(r'^[^\S\n]*' + _NUMBERED_HEADING_EXPRESSION, re.MULTILINE),
+        False,
+    ),
+    "caps": (None, True),
+}
+
+SUBCLAUSE_STYLES: Dict[str, re.Pattern] = {
+    "any": SUBCLAUSE_PATTERN,
+    "paren": re.compile(
+        r'^[^\S\n]*' + _PAREN_MARKER_EXPRESSION + r'[^\S\n]+',
+        re.MULTILINE
+    ),
+    "suffix": re.compile(
+        r'^[^\S\n]*' + _SUFFIX_MARKER_EXPRESSION + r'[^\S\n]+',
+        re.MULTILINE
+    ),
+}
 
 class ContractSegmenter:
     def __init__(
         self,
         min_clause_len_chars: int = 25,
         merge_short_clauses: bool = True,
+        heading_style: str = "any",
+        subclause_style: str = "any",
     ) -> None:
+        """
+        heading_style: "any", or one of "section" ("Section 1. Term"),
+            "numbered" ("1.1 Scope") or "caps" ("CONFIDENTIALITY") to only
+            recognize that heading form.
+        subclause_style: "any", or "paren" ("(a) Text") or "suffix"
+            ("a) Text") to only recognize that subclause marker.
+        """
+        if heading_style not in HEADING_STYLES:
+            raise ValueError(
+                f"Unknown heading_style: {heading_style!r}. "
+                f"Use one of {', '.join(HEADING_STYLES)}"
+            )
+        if subclause_style not in SUBCLAUSE_STYLES:
+            raise ValueError(
+                f"Unknown subclause_style: {subclause_style!r}. "
+                f"Use one of {', '.join(SUBCLAUSE_STYLES)}"
+            )
 
         self.min_clause_len_chars = min_clause_len_chars
         self.merge_short_clauses = merge_short_clauses
+        self.heading_style = heading_style
+        self.subclause_style = subclause_style
+
+        # Resolved once here so the per-line code has no style branches
+        self._heading_pattern, self._caps_headings = HEADING_STYLES[heading_style]
+        self._heading_line_scan = (
+            _line_scanner(self._heading_pattern)
+            if self._heading_pattern is not None
+            else None
+        )
+        self._subclause_match = SUBCLAUSE_STYLES[subclause_style].match
+        self._subclause_line_scan = _line_scanner(SUBCLAUSE_STYLES[subclause_style])
 
     def segment_contract(self, text: str) -> List[Dict[str, Any]]:
         text = self._preprocess(text)
@@ -67,116 +344,165 @@ class ContractSegmenter:
         clauses = self._cleanup_clauses(clauses)
 
         # Return list of plain dicts
-        return [asdict(c) for c in clauses]
+        return [_clause_to_dict(c) for c in clauses]
+
+    def segment_contract_stream(
+        self, pages: Iterable[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming variant of segment_contract for page-by-page input.
+        Yields the same clause dicts as segment_contract("\n\n".join(pages)),
+        but each section is segmented and released as soon as it closes.
+        """
+        clause_id = 0
+        for sec in self._iter_sections(self._iter_preprocessed_pages(pages)):
+            clauses = self._segment_clauses_within_sections([sec])
+            for cl in self._cleanup_clauses(clauses):
+                clause_id += 1
+                cl.clause_id = clause_id
+                yield _clause_to_dict(cl)
+
+    def _iter_preprocessed_pages(self, pages: Iterable[str]) -> Iterator[str]:
+        for i, page in enumerate(pages):
+            if i:
+                # Blank line between pages, as in "\n\n".join(pages)
+                yield ""
+            if page.endswith("\r"):
+                # Would have formed a "\r\n" pair with the page separator
+                page = page[:-1]
+            yield self._preprocess(page)
 
     def _preprocess(self, text: str) -> str:
         if not text:
             return ""
 
         # Normalize line endings
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
-        text = re.sub(r"[ \t]+", " ", text)
+        if "\r" in text:
+            text = LINE_BREAK_PATTERN.sub("\n", text)
+        text = WHITESPACE_PATTERN.sub(" ", text)
 
         # Strip trailing spaces on each line
-        lines = [ln.rstrip() for ln in text.split("\n")]
-        return "\n".join(lines)
+        return "\n".join([ln.rstrip() for ln in text.split("\n")])
 
-    def _is_section_heading(self, line: str) -> bool:
+    def _heading_offsets(self, text: str) -> Set[int]:
         """
-        Check: does this line look like a section heading?
+        Start offsets of every line matching a section or numbered heading.
         """
-        s = line.strip()
-        if not s:
-            return False
-
-        # "Section 1. Term", "Article II - Definitions"
-        if SECTION_HEADING_PATTERN.match(s):
-            return True
-
-        # "1. Term", "1.1 Grant of License"
-        if NUMBERED_HEADING_PATTERN.match(s):
-            return True
-
-        # ALL CAPS headings
-        if looks_like_all_caps_heading(s):
-            return True
-
-        return False
+        pattern = self._heading_pattern
+        if pattern is None:
+            return set()
+        if (
+            pattern is HEADING_PATTERN
+            and _heading_scanner is not None
+            and text
+            and text.isascii()
+        ):
+            return _heading_scanner(text.encode("ascii"))
+        return set(self._heading_line_scan(text))
 
     def _segment_sections(self, text: str) -> List[Section]:
-        lines = text.split("\n")
+        return list(self._iter_sections([text]))
 
-        sections: List[Section] = []
+    def _heading_line_starts(self, text: str) -> List[int]:
+        """
+        Sorted start offsets of every heading line in `text`.
+        """
+        starts = self._heading_offsets(text)
+        if not self._caps_headings:
+            return sorted(starts)
+
+        # ALL CAPS headings can't be expressed as a regex (ratio test),
+        # so only lines the combined pattern missed fall through to it.
+        is_caps_heading = looks_like_all_caps_heading
+        offset = 0
+        for line in text.split("\n"):
+            if line and offset not in starts and is_caps_heading(line):
+                starts.add(offset)
+            offset += len(line) + 1
+        return sorted(starts)
+
+    def _iter_sections(self, chunks: Iterable[str]) -> Iterator[Section]:
+        """
+        Yield sections from preprocessed text that arrives as chunks of whole
+        lines (the document is "\n".join(chunks)). Section bodies are sliced
+        between heading offsets; only the open section's text is kept
+        between chunks.
+        """
         current_heading: Optional[str] = None
-        current_lines: List[str] = []
+        # Body of the open section, one piece per chunk it spans
+        open_parts: List[str] = []
         section_id = 0
+        # Chunks seen before the first section, for the no-heading fallback
+        pending: List[str] = []
 
-        for line in lines:
-            if self._is_section_heading(line):
-                # Flush previous section (if any)
-                if current_heading is not None or current_lines:
-                    section_text = "\n".join(current_lines).strip()
-                    if section_text:
-                        section_id += 1
-                        sections.append(
-                            Section(
-                                section_id=section_id,
-                                heading=current_heading,
-                                text=section_text,
-                            )
-                        )
-
-                # Start new section
-                current_heading = line.strip()
-                current_lines = []
-            else:
-                if line.strip() or current_lines:
-                    current_lines.append(line)
+        for chunk in chunks:
+            if not section_id:
+                pending.append(chunk)
+            body_start = 0
 
-        # Flush last section
-        if current_heading is not None or current_lines:
-            section_text = "\n".join(current_lines).strip()
-            if section_text:
-                section_id += 1
-                sections.append(
-                    Section(
+            for heading_start in self._heading_line_starts(chunk):
+                # Flush previous section (if any)
+                open_parts.append(chunk[body_start:heading_start])
+                section_text = "\n".join(open_parts).strip()
+                if section_text:
+                    section_id += 1
+                    yield Section(
                         section_id=section_id,
                         heading=current_heading,
                         text=section_text,
                     )
-                )
 
-        # If we never detected any heading at all, treat whole doc as one section
-        if not sections and text.strip():
-            sections.append(
-                Section(section_id=1, heading=None, text=text.strip())
+                # Start new section
+                heading_end = chunk.find("\n", heading_start)
+                if heading_end < 0:
+                    heading_end = len(chunk)
+                current_heading = chunk[heading_start:heading_end].strip()
+                open_parts = []
+                body_start = heading_end + 1
+
+            open_parts.append(chunk[body_start:])
+            if section_id:
+                pending.clear()
+
+        # Flush last section
+        section_text = "\n".join(open_parts).strip()
+        if section_text:
+            section_id += 1
+            yield Section(
+                section_id=section_id,
+                heading=current_heading,
+                text=section_text,
             )
 
-        return sections
+        # If we never detected any heading at all, treat whole doc as one section
+        if not section_id:
+            text = "\n".join(pending).strip()
+            if text:
+                yield Section(section_id=1, heading=None, text=text)
 
-    def _parse_subclause_label(self, line: str) -> Optional[str]:
+    def _split_subclause_marker(self, line: str) -> Optional[Tuple[str, str]]:
         """
         Check if a line starts a subclause (e.g., "(a) Text" or "a) Text").
-        Returns the label (e.g., "(a)", "a)", "(1)") or None.
+        Returns (label, text without the marker), e.g. ("(a)", "Text"),
+        or None if the line has no marker.
         """
-        m = SUBCLAUSE_PAREN_PATTERN.match(line)
-        if m:
-            raw = m.group(1)
-            # Return normalized label with parentheses: e.g. "(a)"
-            return f"({raw})"
+        m = self._subclause_match(line)
+        if m is None:
+            return None
 
-        m = SUBCLAUSE_SUFFIX_PATTERN.match(line)
-        if m:
-            raw = m.group(1)
+        rest = line[m.end():]
+        if m.lastgroup == "paren":
+            # Return normalized label with parentheses: e.g. "(a)"
+            label = f"({m.group('paren')})"
+            # A suffix marker right after it is dropped too: "(a) 1) Text"
+            m = _suffix_match(rest)
+            if m:
+                rest = rest[m.end():]
+        else:
             # Return normalized label with suffix: e.g. "a)"
-            return f"{raw})"
+            label = f"{m.group('suffix')})"
 
-        return None
-
-    def _strip_subclause_marker(self, line: str) -> str:
-        line = SUBCLAUSE_PAREN_PATTERN.sub("", line, count=1)
-        line = SUBCLAUSE_SUFFIX_PATTERN.sub("", line, count=1)
-        return line.lstrip()
+        return label, rest.lstrip()
 
     def _segment_clauses_within_sections(
         self, sections: List[Section]
@@ -186,55 +512,45 @@ class ContractSegmenter:
         If no markers are found, treat the whole section as a single clause.
         """
         clauses: List[Clause] = []
-        global_clause_id = 0
+        split_marker = self._split_subclause_marker
+        marker_line_starts = self._subclause_line_scan
 
         for sec in sections:
-            lines = sec.text.split("\n")
+            text = sec.text
             local_index = 0
+            # Label and marker-line remainder of the open clause; its body
+            # runs from body_start up to the next marker line
             current_label: Optional[str] = None
-            current_lines: List[str] = []
-
-            def flush_current():
-                nonlocal global_clause_id, local_index, current_lines, current_label
-                text_block = "\n".join(current_lines).strip()
-                if text_block:
-                    global_clause_id += 1
-                    local_index += 1
-                    clauses.append(
-                        Clause(
-                            clause_id=global_clause_id,
-                            section_id=sec.section_id,
-                            section_heading=sec.heading,
-                            local_index=local_index,
-                            label=current_label,
-                            text=text_block,
-                        )
-                    )
-                current_lines = []
-                current_label = None
-
-            # Track if we ever saw any subclause pattern in this section
-            saw_subclause_pattern = False
-
-            for line in lines:
-                label = self._parse_subclause_label(line)
-                if label is not None:
-                    saw_subclause_pattern = True
-                    # New subclause: flush previous
-                    flush_current()
-                    current_label = label
-                    # Add line without the label
-                    stripped = self._strip_subclause_marker(line)
-                    if stripped:
-                        current_lines.append(stripped)
-                else:
-                    # Continuation of current subclause (if any)
-                    # or plain text inside section without explicit labels
-                    if line.strip() or current_lines:
-                        current_lines.append(line)
+            current_head = ""
+            body_start = 0
+
+            for marker_start in marker_line_starts(text):
+                # New subclause: flush previous
+                local_index = _flush_clause(
+                    clauses,
+                    sec,
+                    current_head + "\n" + text[body_start:marker_start],
+                    current_label,
+                    local_index,
+                )
+
+                line_end = text.find("\n", marker_start)
+                if line_end < 0:
+                    line_end = len(text)
+                # Keep the marker line without the label
+                current_label, current_head = split_marker(
+                    text[marker_start:line_end]
+                )
+                body_start = line_end + 1
 
             # Flush last clause in this section
-            flush_current()
+            _flush_clause(
+                clauses,
+                sec,
+                current_head + "\n" + text[body_start:],
+                current_label,
+                local_index,
+            )
 
         return clauses
 
@@ -243,6 +559,9 @@ class ContractSegmenter:
             return clauses
 
         cleaned: List[Clause] = []
+        # Texts of the current merge run (cleaned[-1] plus the short clauses
+        # folded into it), joined once when the run ends
+        merge_run: List[str] = []
         for clause in clauses:
             # If this clause is very short and we have a previous one, merge
             if (
@@ -250,53 +569,96 @@ class ContractSegmenter:
                 and len(clause.text.strip()) < self.min_clause_len_chars
                 and clause.section_id == cleaned[-1].section_id
             ):
-                # Merge into previous clause (same section)
-                prev = cleaned[-1]
-                merged_text = prev.text.rstrip() + "\n" + clause.text.lstrip()
-                cleaned[-1] = Clause(
-                    clause_id=prev.clause_id,
-                    section_id=prev.section_id,
-                    section_heading=prev.section_heading,
-                    local_index=prev.local_index,
-                    label=prev.label,  # keep previous label
-                    text=merged_text,
-                )
+                # Merge into previous clause (same section), keeping its label
+                if not merge_run:
+                    merge_run.append(cleaned[-1].text.strip())
+                merge_run.append(clause.text.strip())
             else:
+                if merge_run:
+                    cleaned[-1].text = "\n".join(merge_run)
+                    merge_run = []
                 cleaned.append(clause)
 
+        if merge_run:
+            cleaned[-1].text = "\n".join(merge_run)
+
         # Re-number global clause_id to keep it simple (optional)
         for idx, cl in enumerate(cleaned, start=1):
-            cleaned[idx - 1] = Clause(
-                clause_id=idx,
-                section_id=cl.section_id,
-                section_heading=cl.section_heading,
-                local_index=cl.local_index,
-                label=cl.label,
-                text=cl.text,
-            )
+            cl.clause_id = idx
 
         return cleaned
 
 
-def load_contract_text(input_path: str) -> str:
+# Below this many pages, extracting in the current process beats the cost
+# of starting workers and re-opening the PDF in each of them.
+PDF_PARALLEL_MIN_PAGES = 4
+
+
+def _extract_page_range(args: Tuple[str, int, int]) -> List[str]:
+    """
+    Worker for _iter_pdf_pages_pypdf2: open the PDF and extract pages [start, stop).
+    """
+    input_path, start, stop = args
+    reader = PdfReader(input_path)
+    # page.extract_text() returns a string or None
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _iter_pdf_pages_pymupdf(doc) -> Iterator[str]:
+    with doc:
+        for page in doc:
+            yield page.get_text("text")
+
+
+def _iter_pdf_pages_pypdf2(reader: PdfReader, input_path: str) -> Iterator[str]:
+    n_pages = len(reader.pages)
+    n_workers = min(os.cpu_count() or 1, n_pages)
+
+    if n_pages < PDF_PARALLEL_MIN_PAGES or n_workers < 2:
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
+
+    # One contiguous page range per worker, so each process parses the
+    # PDF once rather than once per page.
+    step = -(-n_pages // n_workers)
+    ranges = [
+        (input_path, start, min(start + step, n_pages))
+        for start in range(0, n_pages, step)
+    ]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+        for chunk in ex.map(_extract_page_range, ranges):
+            yield from chunk
+
+
+def iter_contract_pages(input_path: str) -> Iterator[str]:
+    """
+    Iterate over the contract text one page at a time (a .txt file is a
+    single page). The file is opened here, so a bad path or file type
+    raises immediately rather than on first iteration.
+    """
     ext = os.path.splitext(input_path)[1].lower()
 
     if ext == ".txt":
         with open(input_path, "r", encoding="utf-8") as f:
-            return f.read()
+            return iter([f.read()])
 
     elif ext == ".pdf":
-        reader = PdfReader(input_path)
-        parts = []
-        for page in reader.pages:
-            # page.extract_text() returns a string or None
-            text = page.extract_text() or ""
-            parts.append(text)
-        return "\n\n".join(parts)
+        # PyMuPDF extracts in C; PyPDF2 is the pure-Python fallback
+        if pymupdf is not None:
+            return _iter_pdf_pages_pymupdf(pymupdf.open(input_path))
+        elif PdfReader is not None:
+            return _iter_pdf_pages_pypdf2(PdfReader(input_path), input_path)
+        else:
+            raise ImportError("Reading .pdf files requires PyMuPDF or PyPDF2")
 
     else:
         raise ValueError(f"Unsupported file type: {ext}. Use .txt or .pdf")
 
+
+def load_contract_text(input_path: str) -> str:
+    return "\n\n".join(iter_contract_pages(input_path))
+
 if __name__ == "__main__":
     import sys
 
@@ -307,21 +669,41 @@ if __name__ == "__main__":
     input_path = sys.argv[1]
     output_path = sys.argv[2]
 
-    # Load contract text from .txt or .pdf
+    # Load contract text from .txt or .pdf, one page at a time
     try:
-        contract_text = load_contract_text(input_path)
+        pages = iter_contract_pages(input_path)
     except Exception as e:
         print(f"Error reading input file: {e}")
         sys.exit(1)
 
+    # PDF pages are extracted lazily, so a read error can surface while the
+    # output is being written. Record it, end the stream, and report it below.
+    read_errors: List[Exception] = []
+
+    def read_pages(pages: Iterator[str]) -> Iterator[str]:
+        try:
+            yield from pages
+        except Exception as e:
+            read_errors.append(e)
+
     segmenter = ContractSegmenter()
-    clause_dicts = segmenter.segment_contract(contract_text)
+    clause_dicts = segmenter.segment_contract_stream(read_pages(pages))
 
-    # Write readable output text file
+    # Write readable output text file, one formatted string per clause so
+    # clauses are still written as they stream in
+    separator = "-" * 50
     with open(output_path, "w", encoding="utf-8") as out:
-        for c in clause_dicts:
-            out.write(f"Clause {c['clause_id']}\n")
-            out.write(f"Section: {c['section_heading']}\n")
-            out.write(f"Label: {c['label']}\n")
-            out.write("-" * 50 + "\n")
-            out.write(c["text"] + "\n\n")
\ No newline at end of file
+        out.writelines(
+            f"Clause {c['clause_id']}\n"
+            f"Section: {c['section_heading']}\n"
+            f"Label: {c['label']}\n"
+            f"{separator}\n"
+            f"{c['text']}\n\n"
+            for c in clause_dicts
+        )
+
+    if read_errors:
+        # Don't leave a truncated output file behind
+        os.remove(output_path)
+        print(f"Error reading input file: {read_errors[0]}")
+        sys.exit(1)
\ No newline at end of file